@@ -38,6 +38,7 @@ class ExtensionConfig:
     astronaut_usd: str = ""
     prim_map: Dict[str, str] = field(default_factory=dict)
     event_summary: List[str] = field(default_factory=list)
+    ui_update_interval: float = 0.1
 
     @property
     def config_dir(self) -> Path:
@@ -57,6 +58,7 @@ class ExtensionConfig:
             astronaut_usd=_expand_env(raw.get("astronaut_usd", "")),
             prim_map=dict(raw.get("prim_map", {})),
             event_summary=list(raw.get("event_summary", [])),
+            ui_update_interval=float(raw.get("ui_update_interval", 0.1)),
         )
 
     def resolve_from_config(self, value: str) -> Path:
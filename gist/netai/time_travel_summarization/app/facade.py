@@ -242,6 +242,9 @@ class TimeTravelCore:
             carb.log_error(f"[TimeTravel] Event processing failed: {e}")
             return False
 
+    def get_ui_update_interval(self) -> float:
+        return self._config.ui_update_interval if self._config else 0.1
+
     def should_auto_generate(self) -> bool:
         return bool(self._config and self._config.auto_generate)
 
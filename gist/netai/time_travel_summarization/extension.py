@@ -2,13 +2,16 @@
 # SPDX-License-Identifier: LicenseRef-NvidiaProprietary
 
 import omni.ext
+import omni.kit.app
 import omni.ui as ui
 import omni.usd
 from pxr import Usd, UsdGeom, Gf
 import carb
 import os
+import threading
 from pathlib import Path
 from .ui.main_window import TimeTravelWindow
+from .ui.task_dispatcher import UiTaskDispatcher
 from .app.facade import TimeTravelCore
 from .event_processing.window import EventProcessingWindow
 from .vlm_client.core import VLMClientCore
@@ -28,6 +31,22 @@ except Exception as e:
 class NetAITimetravelDreamAI(omni.ext.IExt):
     """Time Travel Extension for visualizing object movements over time."""
     
+    def __init__(self):
+        super().__init__()
+        self._core = None
+        self._window = None
+        self._event_window = None
+        self._vlm_client_core = None
+        self._vlm_client_window = None
+        self._overlay = None
+        self._overlay_control = None
+        self._app = None
+        self._update_sub = None
+        self._data_loader = None
+        self._data_thread = None
+        self._ui_accum = 0.0
+        self._ui_update_interval = 0.1
+    
     def on_startup(self, ext_id):
         """Initialize the extension."""
         print("[netai.timetravel_dreamai] Extension startup")
@@ -46,8 +65,9 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
         if self._core.load_config(str(config_path)):
             if self._core.should_auto_generate():
                 self._core.auto_generate_astronauts()
-            # Load data
-            self._core.load_data()
+            # Load data in the background so the windows appear immediately
+            self._start_data_load()
+        self._ui_update_interval = self._core.get_ui_update_interval()
         
         # Create main TimeTravel UI window (ALWAYS created)
         self._window = TimeTravelWindow(self._core)
@@ -91,16 +111,40 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
             carb.log_info("[Extension] Overlay features disabled")
         
         # Start update loop (Events 2.0)
-        import omni.kit.app
+        self._app = omni.kit.app.get_app_interface()
         self._update_sub = (
-            omni.kit.app.get_app_interface()
+            self._app
             .get_update_event_stream()
             .create_subscription_to_pop(self._on_update)
         )
+    
+    def _start_data_load(self):
+        """Load trajectory data on a worker thread and finish on the main loop."""
+        core = self._core
+        loader = self._data_loader = UiTaskDispatcher("timetravel_data_load")
         
-        # Set initial time to earliest timestamp
-        if self._core.has_data():
-            self._core.set_to_earliest_time()
+        def load_async():
+            core.load_data()
+            loader.submit(self._on_data_loaded)
+        
+        self._data_thread = threading.Thread(target=load_async, daemon=True)
+        self._data_thread.start()
+    
+    def _on_data_loaded(self):
+        """Apply loaded data to the stage and UI (runs on the main loop)."""
+        if self._core:
+            # Set initial time to earliest timestamp
+            if self._core.has_data():
+                self._core.set_to_earliest_time()
+            
+            if self._window:
+                self._window.refresh_data_range()
+        
+        # One-shot load: release the dispatcher's update subscription
+        if self._data_loader is not None:
+            self._data_loader.shutdown()
+            self._data_loader = None
+        self._data_thread = None
     
     def _on_update(self, e):
         """Update loop for playback and UI updates."""
@@ -109,9 +153,12 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
         # Update core logic (handles playback) - ALWAYS runs
         self._core.update(dt)
         
-        # Update main TimeTravel UI - ALWAYS runs
-        if self._window:
-            self._window.update_ui()
+        # Update main TimeTravel UI - throttled to ui_update_interval (config.json)
+        self._ui_accum += dt
+        if self._ui_accum >= self._ui_update_interval:
+            self._ui_accum = 0.0
+            if self._window:
+                self._window.update_ui()
         
         # Note: ViewOverlay updates itself via frame subscription
         # No need to call update() manually
@@ -121,11 +168,23 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
         print("[netai.timetravel_dreamai] Extension shutdown")
         
         # Clean up subscription
-        if hasattr(self, '_update_sub'):
-            self._update_sub = None
+        self._update_sub = None
+        self._app = None
+        
+        # Stop data load dispatcher (drops a pending result)
+        if self._data_loader is not None:
+            self._data_loader.shutdown()
+            self._data_loader = None
+        
+        # Wait for an in-flight load so it cannot refill the core after it is cleared
+        if self._data_thread is not None:
+            self._data_thread.join(timeout=10.0)
+            if self._data_thread.is_alive():
+                carb.log_warn("[Extension] Data load still running at shutdown")
+            self._data_thread = None
         
         # Clean up main TimeTravel window (ALWAYS cleanup)
-        if hasattr(self, '_window') and self._window:
+        if self._window is not None:
             try:
                 self._window.destroy()
             except Exception as e:
@@ -133,7 +192,7 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
             self._window = None
         
         # Clean up event window
-        if hasattr(self, '_event_window') and self._event_window:
+        if self._event_window is not None:
             try:
                 self._event_window.destroy()
             except Exception as e:
@@ -141,7 +200,7 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
             self._event_window = None
         
         # Clean up VLM Client window
-        if hasattr(self, '_vlm_client_window') and self._vlm_client_window:
+        if self._vlm_client_window is not None:
             try:
                 self._vlm_client_window.destroy()
             except Exception as e:
@@ -149,11 +208,10 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
             self._vlm_client_window = None
         
         # Clean up VLM Client core
-        if hasattr(self, '_vlm_client_core'):
-            self._vlm_client_core = None
+        self._vlm_client_core = None
         
         # Clean up overlay window (OPTIONAL)
-        if hasattr(self, '_overlay_control') and self._overlay_control:
+        if self._overlay_control is not None:
             try:
                 self._overlay_control.destroy()
             except Exception as e:
@@ -161,7 +219,7 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
             self._overlay_control = None
         
         # Clean up overlay (OPTIONAL)
-        if hasattr(self, '_overlay') and self._overlay:
+        if self._overlay is not None:
             try:
                 self._overlay.shutdown()
             except Exception as e:
@@ -169,7 +227,7 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
             self._overlay = None
         
         # Clean up core
-        if hasattr(self, '_core') and self._core:
+        if self._core is not None:
             try:
                 self._core.clear_timetravel_objects()
                 carb.log_info("[Extension] TimeTravel objects cleared")
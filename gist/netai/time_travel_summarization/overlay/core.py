@@ -22,6 +22,7 @@ class ViewOverlay:
         self._visible = True
         self._labels_visible = True
         self._time_visible = True
+        self._last_time_key = False  # never equals a datetime or None, so the first frame renders
 
         self._stage_event_sub = self._usd_context.get_stage_event_stream().create_subscription_to_pop(
             self._on_stage_event, name="ViewOverlayStageEvent"
@@ -107,8 +108,17 @@ class ViewOverlay:
         if self._time_visible:
             try:
                 sim_time = self._core.get_simulation_time()
-                text = sim_time.strftime("%H:%M:%S") if sim_time else "--:--:--"
-                self._time_overlay.set_time_text(text)
+                # The HUD only shows whole seconds, so skip reformatting until it ticks
+                time_key = sim_time.replace(microsecond=0) if sim_time else None
+                if time_key != self._last_time_key:
+                    # Fixed HH:MM:SS shape; f-string avoids strftime's format parsing
+                    text = (
+                        f"{sim_time.hour:02d}:{sim_time.minute:02d}:{sim_time.second:02d}"
+                        if sim_time
+                        else "--:--:--"
+                    )
+                    self._time_overlay.set_time_text(text)
+                    self._last_time_key = time_key
             except Exception as error:
                 carb.log_error(f"[ViewOverlay] Error updating time: {error}")
 
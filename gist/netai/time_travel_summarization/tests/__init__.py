@@ -9,3 +9,4 @@
 # its affiliates is strictly prohibited.
 
 from .test_smoke import *
+from .test_compare_results import *
@@ -0,0 +1,102 @@
+import contextlib
+import importlib.util
+import io
+import json
+import tempfile
+from pathlib import Path
+import unittest
+
+_MODULE_PATH = Path(__file__).resolve().parents[1] / "utils" / "compare_results.py"
+_spec = importlib.util.spec_from_file_location("compare_results", _MODULE_PATH)
+compare_results = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(compare_results)
+
+
+class CompareResultsTest(unittest.TestCase):
+    def _parse_contents(self, *contents):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = Path(tmp_dir) / "prediction.json"
+            json_path.write_text(
+                json.dumps({"chunk_responses": [{"content": content} for content in contents]}),
+                encoding="utf-8",
+            )
+            with contextlib.redirect_stdout(io.StringIO()):
+                return compare_results.parse_prediction_json(str(json_path))
+
+    def test_fenced_array_requires_closing_fence(self):
+        predictions = self._parse_contents(
+            'Result:\n```json\n[{"00:00:01": [1, 2]}]\n```',
+            '```json [{"00:00:54": [3, 4]}]',
+        )
+
+        self.assertEqual(list(predictions), ["00:00:01"])
+
+    def test_bare_array_with_trailing_data_is_rejected(self):
+        predictions = self._parse_contents('[{"00:00:01": [1, 2]}] [1]')
+
+        self.assertEqual(predictions, {})
+
+    def test_invalid_object_ids_are_scored_as_incorrect_predictions(self):
+        ground_truth = compare_results.parse_ground_truth("00:00:01 1,2\n00:00:02 3\n00:00:03 1")
+        predictions = self._parse_contents(
+            '[{"00:00:01": ["1", "2"]}, {"00:00:02": [-1]}, {"00:00:03": ["person_1"]}]'
+        )
+
+        precision, recall, f1, details = compare_results.calculate_metrics(ground_truth, predictions)
+
+        self.assertEqual((precision, recall, f1), (0, 0, 0))
+        self.assertEqual(
+            [item["predicted"] for item in details["incorrect_predictions"]],
+            [["1", "2"], [-1], ["person_1"]],
+        )
+
+    def test_large_and_unsortable_object_ids_keep_flat_raw_lists(self):
+        ground_truth = compare_results.parse_ground_truth("00:00:01 1,2\n00:00:02 3")
+        predictions = self._parse_contents(
+            '[{"00:00:01": [1, 20250101]}, {"00:00:02": [1, "a"]}, {"00:00:03": [10000000000]}]'
+        )
+
+        precision, recall, f1, details = compare_results.calculate_metrics(ground_truth, predictions)
+
+        self.assertEqual((precision, recall, f1), (0, 0, 0))
+        self.assertEqual(
+            [item["predicted"] for item in details["incorrect_predictions"]],
+            [[1, 20250101], [1, "a"]],
+        )
+        self.assertEqual(details["extra_timestamps"][0]["predicted"], [10000000000])
+
+    def test_large_object_ids_still_match_ground_truth(self):
+        ground_truth = compare_results.parse_ground_truth("00:00:01 2,300")
+        predictions = self._parse_contents('[{"00:00:01": [300, 2]}]')
+
+        precision, recall, f1, details = compare_results.calculate_metrics(ground_truth, predictions)
+
+        self.assertEqual((precision, recall), (1, 1))
+        self.assertEqual(details["correct"][0]["objects"], [2, 300])
+
+    def test_write_result_json_round_trips(self):
+        metrics = {"precision": 0.67, "recall": 0.33, "f1_score": 0.44}
+        details = {
+            "correct": [{"timestamp": "00:00:01", "objects": [1, 2]}],
+            "missing_timestamps": [
+                {"timestamp": "00:00:02", "ground_truth": [1, 2]},
+                {"timestamp": "00:00:48", "ground_truth": [3]},
+            ],
+            "extra_timestamps": [],
+            "incorrect_predictions": [
+                {"timestamp": "00:00:41", "ground_truth": [1, 3], "predicted": ["사람_1"]},
+            ],
+        }
+        buffer = io.StringIO()
+
+        compare_results.write_result_json(buffer, "결과_video_19.json", metrics, details)
+
+        self.assertEqual(
+            json.loads(buffer.getvalue()),
+            {"source_file": "결과_video_19.json", "metrics": metrics, "details": details},
+        )
+        self.assertIn("사람_1", buffer.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
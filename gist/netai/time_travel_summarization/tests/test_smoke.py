@@ -15,6 +15,7 @@ class RefactoringSmokeTest(unittest.TestCase):
 
         self.assertTrue(config.data_path.endswith(".csv"))
         self.assertIsInstance(config.prim_map, dict)
+        self.assertEqual(config.ui_update_interval, 0.1)
 
     def test_trajectory_repository_returns_last_known_value(self):
         repository = TrajectoryRepository()
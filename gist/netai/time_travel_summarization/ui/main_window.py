@@ -12,6 +12,7 @@ class TimeTravelWindow:
         """Initialize the Time Travel window."""
         self._core = core
         self._updating_slider = False  # Flag to prevent infinite loops
+        self._last_ui_time = None  # Stage time shown by the last update_ui refresh
         
         # Create window
         self._window = ui.Window("Time Travel", width=500, height=450)
@@ -41,29 +42,30 @@ class TimeTravelWindow:
                     ui.Line(style={"color": 0xFF666666})
                 
                 # Go to time controls
+                current = self._core.get_current_time()
                 ui.Label("Go to Time:", style={"font_size": 14, "font_weight": "bold"})
                 with ui.HStack(height=25):
                     # Date inputs
                     self._goto_year = ui.IntField(width=50)
-                    self._goto_year.model.set_value(self._core.get_current_time().year)
+                    self._goto_year.model.set_value(current.year)
                     ui.Label("/", width=10)
                     self._goto_month = ui.IntField(width=35)
-                    self._goto_month.model.set_value(self._core.get_current_time().month)
+                    self._goto_month.model.set_value(current.month)
                     ui.Label("/", width=10)
                     self._goto_day = ui.IntField(width=35)
-                    self._goto_day.model.set_value(self._core.get_current_time().day)
+                    self._goto_day.model.set_value(current.day)
                     
                     ui.Spacer(width=20)
                     
                     # Time inputs
                     self._goto_hour = ui.IntField(width=35)
-                    self._goto_hour.model.set_value(self._core.get_current_time().hour)
+                    self._goto_hour.model.set_value(current.hour)
                     ui.Label(":", width=10)
                     self._goto_minute = ui.IntField(width=35)
-                    self._goto_minute.model.set_value(self._core.get_current_time().minute)
+                    self._goto_minute.model.set_value(current.minute)
                     ui.Label(":", width=10)
                     self._goto_second = ui.IntField(width=35)
-                    self._goto_second.model.set_value(self._core.get_current_time().second)
+                    self._goto_second.model.set_value(current.second)
                     
                     ui.Spacer(width=10)
                     self._goto_button = ui.Button("Go", width=50)
@@ -238,22 +240,38 @@ class TimeTravelWindow:
         self._goto_minute.model.set_value(current.minute)
         self._goto_second.model.set_value(current.second)
     
-    def update_ui(self):
-        """Update UI elements (called every frame)."""
-        # Update stage time display
-        self._stage_time_label.text = self._core.get_stage_time_string()
+    def refresh_data_range(self):
+        """Refresh dataset range labels and time controls after data loads."""
+        self._start_label.text = self._core.get_start_time().strftime("%Y-%m-%d %H:%M:%S")
+        self._end_label.text = self._core.get_end_time().strftime("%Y-%m-%d %H:%M:%S")
+        self._update_goto_fields()
         
-        # Update slider if playing (but don't interfere with user dragging)
-        if self._core.is_playing():
+        self._updating_slider = True  # Prevent triggering _on_slider_changed
+        self._time_slider.model.set_value(self._core.get_progress())
+        self._updating_slider = False
+        self._last_ui_time = None
+    
+    def update_ui(self):
+        """Update UI elements (called from the extension update loop)."""
+        # Time-derived widgets only change when the stage time does
+        current_time = self._core.get_simulation_time()
+        if current_time is None or current_time != self._last_ui_time:
+            self._last_ui_time = current_time
+            
+            # Update stage time display
+            self._stage_time_label.text = self._core.get_stage_time_string()
+            
             progress = self._core.get_progress()
-            self._updating_slider = True  # Prevent triggering _on_slider_changed
-            self._time_slider.model.set_value(progress)
-            self._updating_slider = False
-            # self._update_goto_fields()
-        
-        # Update progress percentage
-        progress_pct = self._core.get_progress() * 100
-        self._progress_label.text = f"{progress_pct:.1f}%"
+            
+            # Update slider if playing (but don't interfere with user dragging)
+            if self._core.is_playing():
+                self._updating_slider = True  # Prevent triggering _on_slider_changed
+                self._time_slider.model.set_value(progress)
+                self._updating_slider = False
+                # self._update_goto_fields()
+            
+            # Update progress percentage
+            self._progress_label.text = f"{progress * 100:.1f}%"
         
         # Update play button
         self._update_play_button()
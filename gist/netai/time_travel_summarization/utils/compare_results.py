@@ -34,14 +34,106 @@ Ground Truth:
     4: video_31.mp4 (4개 이벤트)
 """
 
+import contextlib
+import io
 import json
+import os
 import re
 import argparse
-from typing import Dict, Set, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from pathlib import Path
 
+# Optional: orjson이 설치되어 있으면 응답 파일 로드에 사용, 없으면 표준 json 사용
+# (chunk content는 백엔드와 무관하게 항상 같은 디코더로 파싱)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def parse_ground_truth(gt_text: str) -> Dict[str, Set[int]]:
+
+_decoder = json.JSONDecoder()
+# 코드블록 닫힘 확인용: 배열 끝 ']' 뒤에 공백과 ``` 가 오는지
+_FENCE_CLOSE_RE = re.compile(r'\]\s*```')
+
+
+def extract_json_array(content: str):
+    """
+    content에서 JSON 배열을 추출하여 파싱
+    - ```json [ ... ] ``` 코드블록이 있으면 블록 안의 배열을 파싱
+    - 없으면 content 전체가 JSON 배열일 때만 파싱
+    - JSON이 없으면 None, 깨진 JSON이면 json.JSONDecodeError
+    """
+    # 1) 코드블록 JSON 처리: 펜스 뒤 '['부터 바로 디코딩
+    fence = content.find('```json')
+    while fence != -1:
+        start = fence + 7
+        while start < len(content) and content[start].isspace():
+            start += 1
+        if content.startswith('[', start) and _FENCE_CLOSE_RE.search(content, start):
+            items, end = _decoder.raw_decode(content, start)
+            # 배열 바로 뒤에 닫는 펜스가 있어야 함
+            if not _FENCE_CLOSE_RE.match(content, end - 1):
+                raise json.JSONDecodeError("Extra data", content, end)
+            return items
+        fence = content.find('```json', fence + 7)
+
+    # 2) 일반 JSON 문자열일 경우
+    # content 자체가 JSON 배열인지 확인 (뒤에 남는 데이터가 있으면 오류)
+    if content.startswith('[') and content.endswith(']'):
+        return _decoder.decode(content)
+
+    # JSON이 아예 없음
+    return None
+
+
+# 비트마스크로 표현할 객체 id 상한 (그 이상은 리스트로 비교)
+MAX_MASK_ID = 64
+
+
+def ids_to_mask(obj_ids: Iterable[int]) -> int:
+    """객체 id 목록을 비트마스크(int)로 변환 (id n -> n번째 비트)"""
+    mask = 0
+    for obj_id in obj_ids:
+        mask |= 1 << obj_id
+    return mask
+
+
+def ids_to_key(obj_ids) -> Union[int, List]:
+    """
+    객체 id 목록을 비교용 값으로 변환
+    - 모두 MAX_MASK_ID 미만의 0 이상 int이면 비트마스크(int)
+    - 그 외(문자열, 음수, 큰 id 등)는 정렬된 원본 값 리스트로
+      보존 (같은 id 집합이면 항상 같은 표현이 되므로 비교 결과는 동일)
+    """
+    if isinstance(obj_ids, list) and all(type(x) is int and 0 <= x < MAX_MASK_ID for x in obj_ids):
+        return ids_to_mask(obj_ids)
+    try:
+        return sorted(set(obj_ids))
+    except TypeError:
+        return list(obj_ids) if isinstance(obj_ids, list) else [obj_ids]
+
+
+def mask_to_ids(mask: int) -> List[int]:
+    """비트마스크를 정렬된 객체 id 리스트로 변환 (설정된 비트만 순회)"""
+    ids = []
+    while mask:
+        low = mask & -mask
+        ids.append(low.bit_length() - 1)
+        mask ^= low
+    return ids
+
+
+def key_to_ids(key: Union[int, List]) -> List:
+    """ids_to_key 결과를 details 출력용 리스트로 변환"""
+    if isinstance(key, int):
+        return mask_to_ids(key)
+    return key
+
+
+def parse_ground_truth(gt_text: str) -> Dict[str, Union[int, List]]:
     """
     정답지 텍스트를 파싱하여 딕셔너리로 변환
     
@@ -49,7 +141,7 @@ def parse_ground_truth(gt_text: str) -> Dict[str, Set[int]]:
         gt_text: 정답지 텍스트 (예: "00:00:28 1,4")
     
     Returns:
-        {timestamp: set of object ids}
+        {timestamp: bitmask (or sorted list) of object ids}
     """
     ground_truth = {}
     for line in gt_text.strip().split('\n'):
@@ -58,68 +150,62 @@ def parse_ground_truth(gt_text: str) -> Dict[str, Set[int]]:
         parts = line.strip().split()
         if len(parts) >= 2:
             timestamp = parts[0]
-            obj_ids = set(int(x.strip()) for x in parts[1].split(','))
-            ground_truth[timestamp] = obj_ids
+            ground_truth[timestamp] = ids_to_key([int(x) for x in parts[1].split(',')])
     return ground_truth
 
 
-def parse_prediction_json(json_path: str) -> Dict[str, List[Set[int]]]:
+def parse_prediction_json(json_path: str) -> Dict[str, List[Union[int, List]]]:
     """
     예측 결과 JSON 파일을 파싱
     - content가 코드블록(````json ... ````)인지
     - 일반 JSON 배열 문자열인지 둘 다 처리
     - 같은 timestamp에 대한 여러 예측을 List로 보존
+    - 각 예측은 ids_to_key로 변환하여 저장 (비트마스크 또는 정렬된 원본 리스트)
     """
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     predictions = {}
 
     for chunk in data.get('chunk_responses', []):
         content = chunk.get('content', '').strip()
 
-        # 1) 코드블록 JSON 처리
-        json_match = re.search(r'```json\s*(\[.*?\])\s*```', content, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            # 2) 일반 JSON 문자열일 경우
-            # content 자체가 JSON 배열인지 확인
-            if content.startswith('[') and content.endswith(']'):
-                json_str = content
-            else:
-                # JSON이 아예 없으면 그냥 skip
-                continue
-
         # JSON 로드 시도
         try:
-            items = json.loads(json_str)
+            items = extract_json_array(content)
+            if items is None:
+                # JSON이 아예 없으면 그냥 skip
+                continue
             for item in items:
                 if isinstance(item, dict):
                     for timestamp, obj_ids in item.items():
-                        obj_set = set(obj_ids)
+                        prediction = ids_to_key(obj_ids)
                         # 같은 timestamp에 대해 중복된 예측은 제거하되,
                         # 다른 예측은 별도로 보존
                         if timestamp not in predictions:
                             predictions[timestamp] = []
-                        # 동일한 예측이 아니면 추가 (set이므로 순서 무관 비교)
-                        if obj_set not in predictions[timestamp]:
-                            predictions[timestamp].append(obj_set)
+                        # 동일한 예측이 아니면 추가 (ids_to_key 결과이므로 순서 무관 비교)
+                        if prediction not in predictions[timestamp]:
+                            predictions[timestamp].append(prediction)
         except json.JSONDecodeError as e:
             print(f"JSON 파싱 오류: {e}")
             print(f"문제 content:\n{content}")
 
     return predictions
 
-def calculate_metrics(ground_truth: Dict[str, Set[int]], 
-                     predictions: Dict[str, List[Set[int]]]) -> Tuple[float, float, float, Dict]:
+def calculate_metrics(ground_truth: Dict[str, Union[int, List]], 
+                     predictions: Dict[str, List[Union[int, List]]]) -> Tuple[float, float, float, Dict]:
     """
     Precision, Recall, F1 Score 계산
     완전 일치만 True Positive로 판정
     
     Args:
-        ground_truth: 정답 데이터 {timestamp: set of object ids}
-        predictions: 예측 데이터 {timestamp: list of sets of object ids}
+        ground_truth: 정답 데이터 {timestamp: bitmask (or sorted list) of object ids}
+        predictions: 예측 데이터 {timestamp: list of bitmasks (or raw id lists) of object ids}
     
     Returns:
         (precision, recall, f1, details)
@@ -137,8 +223,9 @@ def calculate_metrics(ground_truth: Dict[str, Set[int]],
     
     all_timestamps = set(ground_truth.keys()) | set(predictions.keys())
     
-    for timestamp in sorted(all_timestamps):
-        gt_objects = ground_truth.get(timestamp, set())
+    # 메트릭은 순서와 무관하므로 정렬 없이 순회하고, details만 마지막에 정렬
+    for timestamp in all_timestamps:
+        gt_objects = ground_truth.get(timestamp, 0)
         pred_list = predictions.get(timestamp, [])
         
         if timestamp not in ground_truth:
@@ -146,7 +233,7 @@ def calculate_metrics(ground_truth: Dict[str, Set[int]],
             for pred_objects in pred_list:
                 details['extra_timestamps'].append({
                     'timestamp': timestamp,
-                    'predicted': sorted(pred_objects)
+                    'predicted': key_to_ids(pred_objects)
                 })
                 false_positives += 1
                 
@@ -154,7 +241,7 @@ def calculate_metrics(ground_truth: Dict[str, Set[int]],
             # 정답에 있지만 예측하지 못한 타임스탬프 - FN
             details['missing_timestamps'].append({
                 'timestamp': timestamp,
-                'ground_truth': sorted(gt_objects)
+                'ground_truth': key_to_ids(gt_objects)
             })
             false_negatives += 1
             
@@ -166,19 +253,22 @@ def calculate_metrics(ground_truth: Dict[str, Set[int]],
                     true_positives += 1
                     details['correct'].append({
                         'timestamp': timestamp,
-                        'objects': sorted(gt_objects)
+                        'objects': key_to_ids(gt_objects)
                     })
                 else:
                     # 불일치 - FP (틀린 예측)
                     false_positives += 1
                     details['incorrect_predictions'].append({
                         'timestamp': timestamp,
-                        'ground_truth': sorted(gt_objects),
-                        'predicted': sorted(pred_objects)
+                        'ground_truth': key_to_ids(gt_objects),
+                        'predicted': key_to_ids(pred_objects)
                     })
             
             # FN은 제거: 예측을 했으면 FN이 아님
     
+    for items in details.values():
+        items.sort(key=itemgetter('timestamp'))
+    
     # Precision, Recall, F1 계산
     precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0
     recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0
@@ -187,6 +277,27 @@ def calculate_metrics(ground_truth: Dict[str, Set[int]],
     return precision, recall, f1, details
 
 
+def process_one(json_path: Path,
+                ground_truth: Dict[str, Union[int, List]]) -> Tuple[Optional[Tuple[float, float, float, Dict]], str]:
+    """
+    JSON 파일 하나를 파싱하고 메트릭 계산 (프로세스 풀 작업 단위)
+    - 파싱 중 출력되는 진단 메시지는 부모 프로세스가 파일별로 출력하도록 수집
+    - 오류가 나도 다른 파일 처리는 계속되도록 예외를 결과로 반환
+
+    Returns:
+        ((precision, recall, f1, details) 또는 실패 시 None, 진단 메시지)
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            predictions = parse_prediction_json(str(json_path))
+            result = calculate_metrics(ground_truth, predictions)
+        except Exception as e:
+            print(f"⚠️ 처리 실패: {type(e).__name__}: {e}")
+            result = None
+    return result, log.getvalue()
+
+
 def print_comparison_report(precision: float, recall: float, f1: float, details: Dict):
     """비교 결과 리포트 출력"""
     print("=" * 80)
@@ -221,6 +332,27 @@ def print_comparison_report(precision: float, recall: float, f1: float, details:
     print("\n" + "=" * 80)
 
 
+def write_result_json(f, source_file: str, metrics: Dict, details: Dict):
+    """
+    비교 결과를 파일 스트림에 직접 기록
+    - details 전체를 하나의 문자열로 만들지 않고 항목 단위로 직렬화
+    - 각 항목은 한 줄로 기록
+    """
+    f.write('{\n')
+    f.write(f'  "source_file": {json.dumps(source_file, ensure_ascii=False)},\n')
+    f.write(f'  "metrics": {json.dumps(metrics)},\n')
+    f.write('  "details": {')
+    for i, (key, items) in enumerate(details.items()):
+        f.write(',\n' if i else '\n')
+        f.write(f'    {json.dumps(key)}: [')
+        for j, item in enumerate(items):
+            f.write(',\n' if j else '\n')
+            f.write('      ')
+            f.write(json.dumps(item, ensure_ascii=False))
+        f.write('\n    ]' if items else ']')
+    f.write('\n  }\n}\n')
+
+
 def get_ground_truth_texts():
     """모든 ground truth 데이터를 딕셔너리로 반환"""
     return {
@@ -310,23 +442,39 @@ def main():
         if not json_files[0].exists():
             print(f"⚠️ 파일을 찾을 수 없습니다: {json_files[0]}")
             return
+    elif not outputs_dir.is_dir():
+        json_files = []
     else:
-        # 모든 json 파일 순회
-        json_files = sorted(outputs_dir.glob("*.json"))
+        # 모든 json 파일 순회 (scandir로 디렉토리 항목을 한 번에 읽음)
+        with os.scandir(outputs_dir) as entries:
+            json_files = sorted(
+                (Path(entry.path) for entry in entries
+                 if entry.name.endswith('.json') and entry.is_file()),
+                key=lambda path: path.name
+            )
 
     if not json_files:
         print("⚠️ outputs 폴더에 JSON 파일이 없습니다.")
         return
 
-    for json_file in json_files:
-        print(f"\n📄 처리 중: {json_file.name}")
+    # 정답지는 모든 파일에 공통이므로 한 번만 파싱
+    ground_truth = parse_ground_truth(selected_gt_text)
 
-        # 파싱
-        ground_truth = parse_ground_truth(selected_gt_text)
-        predictions = parse_prediction_json(str(json_file))
+    # 파일별 파싱/메트릭 계산은 서로 독립이므로 프로세스 풀로 분산
+    # (출력과 저장은 순서 유지를 위해 부모 프로세스에서 수행)
+    if len(json_files) > 1:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(partial(process_one, ground_truth=ground_truth), json_files))
+    else:
+        results = [process_one(json_files[0], ground_truth)]
 
-        # 메트릭 계산
-        precision, recall, f1, details = calculate_metrics(ground_truth, predictions)
+    for json_file, (result, log) in zip(json_files, results):
+        print(f"\n📄 처리 중: {json_file.name}")
+        if log:
+            print(log, end='')
+        if result is None:
+            continue
+        precision, recall, f1, details = result
 
         # 결과 출력
         print_comparison_report(precision, recall, f1, details)
@@ -336,16 +484,13 @@ def main():
         result_file = compare_outputs_dir / result_filename
 
         # JSON 저장 (소수점 둘째 자리로 반올림)
+        metrics = {
+            'precision': round(precision, 2),
+            'recall': round(recall, 2),
+            'f1_score': round(f1, 2)
+        }
         with open(result_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'source_file': json_file.name,
-                'metrics': {
-                    'precision': round(precision, 2),
-                    'recall': round(recall, 2),
-                    'f1_score': round(f1, 2)
-                },
-                'details': details
-            }, f, indent=2, ensure_ascii=False)
+            write_result_json(f, json_file.name, metrics, details)
 
         print(f"📁 결과 저장 완료: {result_file}")
 